@@ -1,30 +1,87 @@
 """
 Environment for Behave Testing
+
+To run scenarios in parallel, start one service per worker process:
+
+    SERVICE_PER_WORKER=true behavex --parallel-processes $(( $(nproc) - 2 )) \
+        --parallel-scheme scenario
 """
-from os import getenv
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import httpx
 from selenium import webdriver
 
-WAIT_SECONDS = int(getenv('WAIT_SECONDS', '30'))
-BASE_URL = getenv('BASE_URL', 'http://localhost:8080')
-DRIVER = getenv('DRIVER', 'firefox').lower()
+WAIT_SECONDS = int(os.getenv('WAIT_SECONDS', '30'))
+POLL_SECONDS = float(os.getenv('POLL_SECONDS', '0.1'))
+BASE_URL = os.getenv('BASE_URL', 'http://localhost:8080')
+API_URL = os.getenv('API_URL', 'http://localhost:8082')
+SERVICE_PER_WORKER = os.getenv('SERVICE_PER_WORKER', 'false').lower() == 'true'
+DRIVER = os.getenv('DRIVER', 'firefox').lower()
 
 
 def before_all(context):
     """ Executed once before all tests """
     context.base_url = BASE_URL
+    context.api_url = API_URL
     context.wait_seconds = WAIT_SECONDS
-    # Select either Chrome or Firefox
-    if 'firefox' in DRIVER:
-        context.driver = get_firefox()
-    else:
-        context.driver = get_chrome()
-    context.driver.implicitly_wait(context.wait_seconds)
+    context.poll_seconds = POLL_SECONDS
+    try:
+        if SERVICE_PER_WORKER:
+            # Each worker gets its own service and database so shards can't collide
+            context.service_dir = tempfile.mkdtemp()
+            context.service, context.api_url = start_service(
+                context.service_dir, context.wait_seconds
+            )
+            context.base_url = context.api_url
+        # One keep-alive client for all API calls made by the steps
+        context.http = httpx.Client(
+            base_url=context.api_url,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=8),
+        )
+        # Select either Chrome or Firefox
+        if 'firefox' in DRIVER:
+            context.driver = get_firefox()
+        else:
+            context.driver = get_chrome()
+    except Exception:
+        # behave skips after_all when before_all fails, so release what was started
+        after_all(context)
+        raise
+    # Steps use explicit waits, which return as soon as their condition holds
+    context.driver.implicitly_wait(0)
     context.config.setup_logging()
 
 
+def before_scenario(context, scenario):
+    """ Executed before each scenario """
+    context.element_cache = {}
+    context.product = {}
+    context.response = None
+    context.product_id = None
+
+
 def after_all(context):
     """ Executed after all tests """
-    context.driver.quit()
+    # Any of these may be missing if before_all failed part way through
+    driver = getattr(context, 'driver', None)
+    if driver is not None:
+        driver.quit()
+    http = getattr(context, 'http', None)
+    if http is not None:
+        http.close()
+    service = getattr(context, 'service', None)
+    if service is not None:
+        service.terminate()
+        service.wait()
+    service_dir = getattr(context, 'service_dir', None)
+    if service_dir is not None:
+        shutil.rmtree(service_dir, ignore_errors=True)
 
 ######################################################################
 # Utility functions to create web drivers
@@ -42,5 +99,32 @@ def get_firefox():
     """Creates a headless Firefox driver"""
     options = webdriver.FirefoxOptions()
     options.add_argument("--headless")
-    return webdriver.Firefox(options=options)    
-    
\ No newline at end of file
+    return webdriver.Firefox(options=options)
+
+
+######################################################################
+# Utility functions to run a private service for this worker
+######################################################################
+
+def start_service(directory, timeout):
+    """Starts the service on a free port backed by a SQLite database in directory"""
+    with socket.socket() as sock:
+        sock.bind(('localhost', 0))
+        port = sock.getsockname()[1]
+    database = os.path.join(directory, 'products.db')
+    env = dict(os.environ, FLASK_APP='service:app', DATABASE_URI=f'sqlite:///{database}')
+    service = subprocess.Popen(  # pylint: disable=consider-using-with
+        [sys.executable, '-m', 'flask', 'run', '--port', str(port)], env=env
+    )
+    url = f'http://localhost:{port}'
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f'{url}/health', timeout=1).is_success:
+                return service, url
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    service.terminate()
+    service.wait()
+    raise RuntimeError(f'Service did not start on port {port}')
@@ -1,9 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
 from behave import given, when, then
-import requests
-from urllib.parse import urljoin
 
-# Base URL of your Flask API
-BASE_URL = "http://localhost:8082"  # change to 8080 if that's your running port
+# Paths on the Flask API, requested through the shared context.http client
+# whose base URL is context.api_url (see environment.py)
+PRODUCTS_PATH = "/api/products"
+RESET_PATH = PRODUCTS_PATH + "/reset"
+BULK_PATH = PRODUCTS_PATH + "/bulk"
+SEED_WORKERS = 8
 
 
 ##################################################################
@@ -12,16 +15,28 @@ BASE_URL = "http://localhost:8082"  # change to 8080 if that's your running port
 @given('the following products exist')
 def step_impl(context):
     """Clear existing products and add new ones from table"""
-    requests.delete(urljoin(BASE_URL, "/api/products/reset"))
-    for row in context.table:
-        data = {
+    context.http.delete(RESET_PATH)
+    payload = [
+        {
             "name": row["name"],
             "description": row["description"],
             "price": float(row["price"]),
             "available": row["available"].lower() == "true",
             "category": row["category"]
         }
-        requests.post(urljoin(BASE_URL, "/api/products"), json=data)
+        for row in context.table
+    ]
+    response = context.http.post(BULK_PATH, json=payload)
+    if response.status_code in (404, 405):
+        # bulk route not available: the per-row POSTs are independent
+        with ThreadPoolExecutor(max_workers=SEED_WORKERS) as executor:
+            responses = list(
+                executor.map(lambda data: context.http.post(PRODUCTS_PATH, json=data), payload)
+            )
+        failed = [r.status_code for r in responses if not r.is_success]
+        assert not failed, f"Could not create products: {failed}"
+    else:
+        assert response.is_success, f"Could not create products: {response.status_code} {response.text}"
 
 
 ##################################################################
@@ -30,15 +45,13 @@ def step_impl(context):
 @when('I visit the "Home Page"')
 def step_impl(context):
     """Simulate visiting the home page"""
-    response = requests.get(BASE_URL)
+    response = context.http.get("/")
     context.response = response
 
 
 @when('I set the "{field}" field to "{value}"')
 def step_impl(context, field, value):
     """Set a field value before making an API request"""
-    if not hasattr(context, "product"):
-        context.product = {}
     if field.lower() == "price":
         context.product[field.lower()] = float(value)
     else:
@@ -48,8 +61,6 @@ def step_impl(context, field, value):
 @when('I select "{value}" from the "{field}" dropdown')
 def step_impl(context, value, field):
     """Set dropdown field values like available/category"""
-    if not hasattr(context, "product"):
-        context.product = {}
     if field.lower() == "available":
         context.product["available"] = value.lower() == "true"
     elif field.lower() == "category":
@@ -59,10 +70,8 @@ def step_impl(context, value, field):
 @when('I press the "Create" button')
 def step_impl(context):
     """Send POST request to create a product"""
-    context.response = requests.post(
-        urljoin(BASE_URL, "/api/products"), json=context.product
-    )
-    if context.response.ok:
+    context.response = context.http.post(PRODUCTS_PATH, json=context.product)
+    if context.response.is_success:
         context.product_id = context.response.json().get("id", None)
 
 
@@ -18,6 +18,7 @@ Steps file for web interactions with Selenium
 For information on Waiting until elements are present in the HTML see:
 https://selenium-python.readthedocs.io/waits.html
 """
+import functools
 import logging
 from behave import when, then
 from selenium.webdriver.common.by import By
@@ -25,6 +26,70 @@ from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 ID_PREFIX = "product_"
+SET_VALUE_SCRIPT = (
+    "arguments[0].value = arguments[1];"
+    "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+    "arguments[0].dispatchEvent(new Event('change', {bubbles: true}));"
+)
+INNER_TEXT_SCRIPT = (
+    "const element = document.getElementById(arguments[0]);"
+    "return element ? element.innerText : '';"
+)
+TEXT_POLL_SECONDS = 0.05
+
+
+@functools.lru_cache(maxsize=64)
+def _element_id(element_name):
+    """Returns the HTML id for a named field"""
+    return ID_PREFIX + element_name.lower().replace(" ", "_")
+
+
+@functools.lru_cache(maxsize=64)
+def _button_id(button):
+    """Returns the HTML id for a named button"""
+    return f"{button.lower()}-btn"
+
+
+def _wait(context, poll_frequency=None):
+    """Returns an explicit wait that polls faster than Selenium's 500ms default"""
+    return WebDriverWait(
+        context.driver, context.wait_seconds,
+        poll_frequency=poll_frequency or context.poll_seconds
+    )
+
+
+def _wait_for(context, locator):
+    """Waits explicitly for an element to be present and returns it"""
+    return _wait(context).until(
+        EC.presence_of_element_located(locator)
+    )
+
+
+def _get(context, element_id):
+    """Returns the element with the given id, looking it up only once per scenario"""
+    element = context.element_cache.get(element_id)
+    if element is None:
+        element = _wait_for(context, (By.ID, element_id))
+        context.element_cache[element_id] = element
+    return element
+
+
+def _set_value(context, element_id, value):
+    """Sets a field's value with one script call instead of clear() + send_keys()"""
+    element = _get(context, element_id)
+    context.driver.execute_script(SET_VALUE_SCRIPT, element, value)
+
+
+def _inner_text(driver, element_id):
+    """Returns an element's text with a single script call"""
+    return driver.execute_script(INNER_TEXT_SCRIPT, element_id)
+
+
+def _wait_for_text(context, element_id, text):
+    """Waits until text shows up inside an element"""
+    return _wait(context, TEXT_POLL_SECONDS).until(
+        lambda driver: text in _inner_text(driver, element_id)
+    )
 
 
 ##################################################################
@@ -39,40 +104,37 @@ def step_impl(context, message):
 @then('I should not see "{text_string}"')
 def step_impl(context, text_string):
     """Ensure text is not visible in the page body"""
-    element = context.driver.find_element(By.TAG_NAME, "body")
+    element = _wait_for(context, (By.TAG_NAME, "body"))
     assert text_string not in element.text
 
 
 @when('I set the "{element_name}" to "{text_string}"')
 def step_impl(context, element_name, text_string):
     """Set a text field to the given string"""
-    element_id = ID_PREFIX + element_name.lower().replace(" ", "_")
-    element = context.driver.find_element(By.ID, element_id)
-    element.clear()
-    element.send_keys(text_string)
+    _set_value(context, _element_id(element_name), text_string)
 
 
 @when('I select "{text}" in the "{element_name}" dropdown')
 def step_impl(context, text, element_name):
     """Select a value from a dropdown"""
-    element_id = ID_PREFIX + element_name.lower().replace(" ", "_")
-    element = Select(context.driver.find_element(By.ID, element_id))
+    element_id = _element_id(element_name)
+    element = Select(_get(context, element_id))
     element.select_by_visible_text(text)
 
 
 @then('I should see "{text}" in the "{element_name}" dropdown')
 def step_impl(context, text, element_name):
     """Verify dropdown selection"""
-    element_id = ID_PREFIX + element_name.lower().replace(" ", "_")
-    element = Select(context.driver.find_element(By.ID, element_id))
+    element_id = _element_id(element_name)
+    element = Select(_get(context, element_id))
     assert element.first_selected_option.text == text
 
 
 @then('the "{element_name}" field should be empty')
 def step_impl(context, element_name):
     """Verify that a field is empty"""
-    element_id = ID_PREFIX + element_name.lower().replace(" ", "_")
-    element = context.driver.find_element(By.ID, element_id)
+    element_id = _element_id(element_name)
+    element = _get(context, element_id)
     assert element.get_attribute("value") == u""
 
 
@@ -82,10 +144,8 @@ def step_impl(context, element_name):
 @when('I copy the "{element_name}" field')
 def step_impl(context, element_name):
     """Copy text from a field"""
-    element_id = ID_PREFIX + element_name.lower().replace(" ", "_")
-    element = WebDriverWait(context.driver, context.wait_seconds).until(
-        EC.presence_of_element_located((By.ID, element_id))
-    )
+    element_id = _element_id(element_name)
+    element = _get(context, element_id)
     context.clipboard = element.get_attribute("value")
     logging.info("Clipboard contains: %s", context.clipboard)
 
@@ -93,12 +153,7 @@ def step_impl(context, element_name):
 @when('I paste the "{element_name}" field')
 def step_impl(context, element_name):
     """Paste text into a field"""
-    element_id = ID_PREFIX + element_name.lower().replace(" ", "_")
-    element = WebDriverWait(context.driver, context.wait_seconds).until(
-        EC.presence_of_element_located((By.ID, element_id))
-    )
-    element.clear()
-    element.send_keys(context.clipboard)
+    _set_value(context, _element_id(element_name), context.clipboard)
 
 
 ##################################################################
@@ -107,35 +162,30 @@ def step_impl(context, element_name):
 @when('I press the "{button}" button')
 def step_impl(context, button):
     """Press a button by name"""
-    button_id = f"{button.lower()}-btn"
-    element = context.driver.find_element(By.ID, button_id)
+    element = _get(context, _button_id(button))
     element.click()
 
 
 @then('I should see "{name}" in the results')
 def step_impl(context, name):
     """Check if the product name appears in search results"""
-    wait = WebDriverWait(context.driver, context.wait_seconds)
-    found = wait.until(
-        EC.text_to_be_present_in_element((By.ID, "search_results"), name)
-    )
+    found = _wait_for_text(context, "search_results", name)
     assert found, f"Expected to see '{name}' in the results."
 
 
 @then('I should not see "{name}" in the results')
 def step_impl(context, name):
     """Check if the product name is absent from search results"""
-    element = context.driver.find_element(By.ID, "search_results")
-    assert name not in element.text, f"Did not expect to see '{name}' in results."
+    # wait for the results table first, or a missing one reads as no text
+    _get(context, "search_results")
+    text = _inner_text(context.driver, "search_results")
+    assert name not in text, f"Did not expect to see '{name}' in results."
 
 
 @then('I should see the message "{message}"')
 def step_impl(context, message):
     """Verify a flash message appears"""
-    wait = WebDriverWait(context.driver, context.wait_seconds)
-    found = wait.until(
-        EC.text_to_be_present_in_element((By.ID, "flash_message"), message)
-    )
+    found = _wait_for_text(context, "flash_message", message)
     assert found, f"Expected flash message '{message}' not found."
 
 
@@ -145,9 +195,10 @@ def step_impl(context, message):
 @then('I should see "{text_string}" in the "{element_name}" field')
 def step_impl(context, text_string, element_name):
     """Verify field value"""
-    element_id = ID_PREFIX + element_name.lower().replace(" ", "_")
-    found = WebDriverWait(context.driver, context.wait_seconds).until(
-        EC.text_to_be_present_in_element_value((By.ID, element_id), text_string)
+    element_id = _element_id(element_name)
+    element = _get(context, element_id)
+    found = _wait(context).until(
+        lambda _: text_string in (element.get_attribute("value") or "")
     )
     assert found
 
@@ -155,9 +206,4 @@ def step_impl(context, text_string, element_name):
 @when('I change "{element_name}" to "{text_string}"')
 def step_impl(context, element_name, text_string):
     """Change a field's value"""
-    element_id = ID_PREFIX + element_name.lower().replace(" ", "_")
-    element = WebDriverWait(context.driver, context.wait_seconds).until(
-        EC.presence_of_element_located((By.ID, element_id))
-    )
-    element.clear()
-    element.send_keys(text_string)
+    _set_value(context, _element_id(element_name), text_string)
@@ -4,9 +4,11 @@ Package: service
 Creates and configures the Flask app, sets up logging, and initializes the database.
 """
 import sys
+import logging
 from flask import Flask
 from service import config
 from service.common import log_handlers
+from service.common.json_provider import OrjsonProvider
 from service.models import init_db
 
 # Create Flask app
@@ -14,9 +16,13 @@ app = Flask(__name__)
 
 # Load Configurations
 app.config.from_object(config)
+app.json = OrjsonProvider(app)
 
-# Set up logging
-log_handlers.init_logging(app, "gunicorn.error")
+# Set up logging (only warnings and errors when running the tests)
+if app.config.get("TESTING"):
+    app.logger.setLevel(logging.WARNING)
+else:
+    log_handlers.init_logging(app, "gunicorn.error")
 
 app.logger.info(70 * "*")
 app.logger.info("  P R O D U C T   S E R V I C E   R U N N I N G  ".center(70, "*"))
@@ -80,6 +80,13 @@ class Product(db.Model):
         db.Enum(Category), nullable=False, server_default=(Category.UNKNOWN.name)
     )
 
+    # Back the name, category and availability queries with indexes
+    __table_args__ = (
+        db.Index("ix_product_name", "name"),
+        db.Index("ix_product_category", "category"),
+        db.Index("ix_product_available", "available"),
+    )
+
     ##################################################
     # INSTANCE METHODS
     ##################################################
@@ -168,6 +175,10 @@ class Product(db.Model):
         db.init_app(app)
         app.app_context().push()
         db.create_all()  # make our sqlalchemy tables
+        # create_all() skips an existing table along with its indexes, so add
+        # any index that an older schema is missing
+        for index in cls.__table__.indexes:
+            index.create(db.engine, checkfirst=True)
 
     @classmethod
     def all(cls) -> list:
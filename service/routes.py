@@ -2,9 +2,13 @@
 Product Store Service with REST API
 """
 from flask import jsonify, request, abort, url_for
-from service.models import Product
+from sqlalchemy import text
+from service.models import Product, Category, db
 from service.common import status
-from . import app, db
+from . import app
+
+# Query string values that mean True for the available filter
+_TRUE_VALUES = frozenset({"true", "1", "yes", "t", "y", "on"})
 
 
 ######################################################################
@@ -36,12 +40,9 @@ def index():
 ######################################################################
 def check_content_type(content_type):
     """Checks that the media type is correct"""
-    if "Content-Type" not in request.headers:
-        app.logger.warning("Missing Content-Type header")
-        abort(status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, f"Content-Type must be {content_type}")
-
-    if request.headers["Content-Type"] != content_type:
-        app.logger.warning("Invalid Content-Type: %s", request.headers["Content-Type"])
+    request_content_type = request.headers.get("Content-Type")
+    if request_content_type != content_type:
+        app.logger.warning("Invalid/missing Content-Type: %s", request_content_type)
         abort(status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, f"Content-Type must be {content_type}")
 
 
@@ -52,7 +53,10 @@ def check_content_type(content_type):
 def reset_products():
     """Removes all products (used for testing)"""
     app.logger.info("Request to reset all products")
-    db.session.query(Product).delete()
+    if db.engine.dialect.name == "postgresql":
+        db.session.execute(text(f"TRUNCATE {Product.__tablename__} RESTART IDENTITY CASCADE"))
+    else:
+        db.session.query(Product).delete()
     db.session.commit()
     return "", status.HTTP_204_NO_CONTENT
 
@@ -80,6 +84,30 @@ def create_products():
     return jsonify(product.serialize()), status.HTTP_201_CREATED, {"Location": location_url}
 
 
+######################################################################
+# C R E A T E   P R O D U C T S   I N   B U L K
+######################################################################
+@app.route("/api/products/bulk", methods=["POST"])
+def create_products_bulk():
+    """Creates a list of Products in a single transaction"""
+    app.logger.info("Request to create products in bulk")
+    check_content_type("application/json")
+
+    data = request.get_json()
+    if not data or not isinstance(data, list):
+        abort(status.HTTP_400_BAD_REQUEST, "Invalid JSON data: expected a list of products")
+
+    products = [Product().deserialize(item) for item in data]
+    db.session.add_all(products)
+    # flush to get the ids, then serialize before commit() expires the rows
+    db.session.flush()
+    message = [product.serialize() for product in products]
+    db.session.commit()
+
+    app.logger.info("Created %d products", len(products))
+    return jsonify(message), status.HTTP_201_CREATED
+
+
 ######################################################################
 # R E A D   A   P R O D U C T
 ######################################################################
@@ -150,22 +178,42 @@ def list_products():
     category = request.args.get("category")
     available = request.args.get("available")
 
-    products = []
-
+    # Each filter given is ANDed onto the query
+    query = Product.query
     if name:
         app.logger.info("Filtering by name: %s", name)
-        products = Product.find_by_name(name)
-    elif category:
+        query = query.filter(Product.name == name)
+    if category:
         app.logger.info("Filtering by category: %s", category)
-        products = Product.find_by_category(category)
-    elif available is not None:
+        category_value = Category.__members__.get(category.upper())
+        if category_value is None:
+            abort(status.HTTP_400_BAD_REQUEST, f"Invalid category: {category}")
+        query = query.filter(Product.category == category_value)
+    if available is not None:
         app.logger.info("Filtering by availability: %s", available)
-        available = available.lower() in ["true", "1", "yes"]
-        products = Product.find_by_availability(available)
-    else:
-        app.logger.info("Returning all products")
-        products = Product.all()
-
-    results = [product.serialize() for product in products]
+        available = available.lower() in _TRUE_VALUES
+        query = query.filter(Product.available == available)
+
+    # Read plain column tuples: same output as Product.serialize() without
+    # building an ORM instance for every row
+    rows = query.with_entities(
+        Product.id,
+        Product.name,
+        Product.description,
+        Product.price,
+        Product.available,
+        Product.category,
+    )
+    results = [
+        {
+            "id": product_id,
+            "name": product_name,
+            "description": description,
+            "price": str(price),
+            "available": is_available,
+            "category": product_category.name,
+        }
+        for product_id, product_name, description, price, is_available, product_category in rows
+    ]
     app.logger.info("Returning %d products", len(results))
     return jsonify(results), status.HTTP_200_OK
@@ -0,0 +1,12 @@
+"""
+Test Package
+
+Importing the service connects to DATABASE_URI and sets up logging, so the
+defaults have to be set before any test module imports it; set
+DATABASE_URI to run against PostgreSQL
+"""
+import os
+
+os.environ.setdefault("DATABASE_URI", "sqlite:///:memory:")
+# skips the gunicorn logging setup in service/__init__.py
+os.environ.setdefault("TESTING", "true")
@@ -0,0 +1,82 @@
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test helpers shared by the model and route test suites
+"""
+
+import os
+from unittest import TestCase
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import scoped_session, sessionmaker
+from service.models import Product, db
+
+
+def worker_database_uri(database_uri: str) -> str:
+    """Returns a database URI private to the current pytest-xdist worker"""
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if not worker:
+        return database_uri
+    url = make_url(database_uri)
+    if url.get_backend_name() == "postgresql":
+        schema = f"test_{worker}"
+        engine = create_engine(url)
+        with engine.begin() as connection:
+            connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+        engine.dispose()
+        url = url.update_query_dict({"options": f"-csearch_path={schema}"})
+    elif url.database and url.database != ":memory:":
+        # every process already has its own in-memory database
+        root, ext = os.path.splitext(url.database)
+        url = url.set(database=f"{root}_{worker}{ext}")
+    return url.render_as_string(hide_password=False)
+
+
+class SavepointTestCase(TestCase):
+    """Runs every test inside a savepoint that is rolled back afterwards
+
+    Subclasses initialize the database before calling super().setUpClass()
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Runs once before the test suite"""
+        # Start from an empty table, whatever earlier runs left behind
+        db.session.query(Product).delete()
+        db.session.commit()
+        # Run every test inside a transaction that is never committed
+        cls.app_session = db.session
+        cls.connection = db.engine.connect()
+        cls.transaction = cls.connection.begin()
+        db.session = scoped_session(
+            sessionmaker(bind=cls.connection, join_transaction_mode="create_savepoint")
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        """Runs once after the test suite"""
+        db.session.remove()
+        cls.transaction.rollback()
+        cls.connection.close()
+        db.session = cls.app_session
+
+    def setUp(self):
+        """Runs before each test"""
+        self.nested = self.connection.begin_nested()
+
+    def tearDown(self):
+        """Runs after each test"""
+        db.session.remove()
+        self.nested.rollback()
@@ -20,6 +20,9 @@ import factory
 from factory import fuzzy
 from service.models import Product, Category
 
+_NAMES = ("Widget", "Gadget", "Doodad", "Thingamajig")
+_CATEGORIES = tuple(Category)
+
 
 # pylint: disable=too-few-public-methods
 class ProductFactory(factory.Factory):
@@ -30,8 +33,8 @@ class ProductFactory(factory.Factory):
         model = Product
 
     id = factory.Sequence(lambda n: n)
-    name = fuzzy.FuzzyChoice(["Widget", "Gadget", "Doodad", "Thingamajig"])
+    name = fuzzy.FuzzyChoice(_NAMES)
     description = factory.Faker("sentence", nb_words=6)
     price = fuzzy.FuzzyDecimal(1.0, 100.0, 2)
-    available = fuzzy.FuzzyChoice([True, False])
-    category = fuzzy.FuzzyChoice(list(Category))
+    available = fuzzy.FuzzyChoice((True, False))
+    category = fuzzy.FuzzyChoice(_CATEGORIES)
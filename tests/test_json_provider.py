@@ -0,0 +1,50 @@
+"""
+Test cases for the orjson JSON Provider
+"""
+from datetime import date
+from decimal import Decimal
+from unittest import TestCase
+from flask import Flask
+from service.common.json_provider import OrjsonProvider
+
+
+class TestOrjsonProvider(TestCase):
+    """Test the orjson JSON Provider"""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.provider = OrjsonProvider(self.app)
+
+    def test_dumps_sorts_keys(self):
+        """It should sort keys unless sort_keys is turned off"""
+        self.assertEqual(self.provider.dumps({"b": 1, "a": 2}), '{"a":2,"b":1}')
+        self.provider.sort_keys = False
+        self.assertEqual(self.provider.dumps({"b": 1, "a": 2}), '{"b":1,"a":2}')
+
+    def test_dumps_non_str_keys(self):
+        """It should serialize dict keys that are not strings"""
+        self.assertEqual(self.provider.dumps({2: "b", 1: "a"}), '{"1":"a","2":"b"}')
+
+    def test_dumps_uses_default(self):
+        """It should serialize Decimal and date values like the stdlib provider"""
+        data = {"price": Decimal("12.50"), "day": date(2023, 1, 31)}
+        self.assertEqual(
+            self.provider.dumps(data), '{"day":"Tue, 31 Jan 2023 00:00:00 GMT","price":"12.50"}'
+        )
+
+    def test_dumps_kwargs_fall_back(self):
+        """It should hand json.dumps arguments to the stdlib provider"""
+        self.assertEqual(self.provider.dumps({"b": 1, "a": 2}, indent=2), '{\n  "a": 2,\n  "b": 1\n}')
+
+    def test_loads(self):
+        """It should parse JSON from str and bytes"""
+        self.assertEqual(self.provider.loads('{"a": [1, 2]}'), {"a": [1, 2]})
+        self.assertEqual(self.provider.loads(b'{"a": null}'), {"a": None})
+        self.assertEqual(self.provider.loads('{"a": 1.5}', parse_float=Decimal), {"a": Decimal("1.5")})
+
+    def test_response(self):
+        """It should build a JSON response"""
+        with self.app.app_context():
+            response = self.provider.response({"b": 1, "a": 2})
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.get_data(as_text=True), '{"a":2,"b":1}')